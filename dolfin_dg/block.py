@@ -159,7 +159,17 @@ def derivative_block(F, u, du=None, coefficient_derivatives=None):
 
     J = [[None for _ in range(m)] for _ in range(n)]
 
+    # If no coefficient derivative map is prescribed, F[i] cannot depend on
+    # u[j] unless u[j] appears among the coefficients of F[i]. Detect this
+    # cheaply up front so the expensive differentiation and lowering passes
+    # only run on the coupled blocks.
+    F_coefficients = None
+    if coefficient_derivatives is None:
+        F_coefficients = [set(F_i.coefficients()) for F_i in F]
+
     for (i, j) in itertools.product(range(n), range(m)):
+        if F_coefficients is not None and u[j] not in F_coefficients[i]:
+            continue
         gateaux_derivative = ufl.derivative(F[i], u[j], du[j],
                                             coefficient_derivatives)
         gateaux_derivative = apply_derivatives(
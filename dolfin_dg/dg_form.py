@@ -75,9 +75,10 @@ def hyper_tensor_product(G, tau):
         return dot(G, tau.T).T
     elif ufl.rank(tau) == 1:
         return dot(G, tau)
-    m, d = tau.ufl_shape
-    return as_matrix([[inner(G[i, k, :, :], tau) for k in range(d)]
-                      for i in range(m)])
+    # Contract in Einstein notation rather than slicing G row by row,
+    # which would allocate an intermediate ComponentTensor per entry
+    i, k, j, l = ufl.indices(4)
+    return as_matrix(G[i, k, j, l]*tau[j, l], (i, k))
 
 
 def hyper_tensor_T_product(G, tau):
@@ -113,9 +114,8 @@ def hyper_tensor_T_product(G, tau):
         return dot(G.T, tau)
     elif ufl.rank(tau) == 1:
         return dot(G.T, tau)
-    m, d = tau.ufl_shape
-    return as_matrix([[inner(G[:, :, i, k], tau) for k in range(d)]
-                      for i in range(m)])
+    i, k, j, l = ufl.indices(4)
+    return as_matrix(G[j, l, i, k]*tau[j, l], (i, k))
 
 
 def dg_outer(*args):
@@ -1,5 +1,6 @@
 import enum
 
+import ufl
 import dolfinx
 from petsc4py import PETSc
 
@@ -13,14 +14,52 @@ class MatrixType(enum.Enum):
         return self is not MatrixType.monolithic
 
 
+def _compile_form(form):
+    """Compile a UFL form (or nested lists thereof, as used by block and
+    nest assembly) with DOLFINx. Forms which are already compiled are
+    returned unchanged, so assembly in the SNES callbacks always dispatches
+    straight to the generated kernels rather than through the JIT cache.
+    """
+    if form is None:
+        return None
+    if isinstance(form, (list, tuple)):
+        return list(map(_compile_form, form))
+    if isinstance(form, ufl.Form):
+        return dolfinx.fem.form(form)
+    return form
+
+
 class NonlinearPDE_SNESProblem():
     def __init__(self, F, J, soln_vars, bcs, P=None):
-        self.L = F
-        self.a = J
-        self.a_precon = P
+        self.L = _compile_form(F)
+        self.a = _compile_form(J)
+        self.a_precon = _compile_form(P)
         self.bcs = bcs
         self.soln_vars = soln_vars
 
+        # The row and column BC maps used by nest assembly are fixed for
+        # the lifetime of the problem, so build them once here rather than
+        # on every residual evaluation
+        self._bcs0 = None
+        self._bcs1 = None
+        if isinstance(self.a, (list, tuple)):
+            self._bcs1 = dolfinx.fem.bcs_by_block(
+                dolfinx.fem.extract_function_spaces(self.a, 1), self.bcs)
+            self._bcs0 = dolfinx.fem.bcs_by_block(
+                dolfinx.fem.extract_function_spaces(self.L), self.bcs)
+
+        # Offsets of each solution variable in the monolithic block vector,
+        # built lazily on the first residual evaluation
+        self._block_layout = None
+
+        # Whether a preconditioner operator is assembled is fixed for the
+        # lifetime of the problem, so bind the Jacobian callbacks without
+        # the P branch when no preconditioner form is supplied
+        if self.a_precon is None:
+            self.J_mono = self._J_mono_no_precon
+            self.J_block = self._J_block_no_precon
+            self.J_nest = self._J_nest_no_precon
+
     def F_mono(self, snes, x, F):
         x.ghostUpdate(addv=PETSc.InsertMode.INSERT, mode=PETSc.ScatterMode.FORWARD)
         with x.localForm() as _x:
@@ -33,15 +72,17 @@ class NonlinearPDE_SNESProblem():
         F.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
         dolfinx.fem.set_bc(F, self.bcs, x, -1.0)
 
-    def J_mono(self, snes, x, J, P):
+    def _J_mono_no_precon(self, snes, x, J, P):
         J.zeroEntries()
         dolfinx.fem.petsc.assemble_matrix(J, self.a, bcs=self.bcs, diagonal=1.0)
         J.assemble()
-        if self.a_precon is not None:
-            P.zeroEntries()
-            dolfinx.fem.petsc.assemble_matrix(
-                P, self.a_precon, bcs=self.bcs, diagonal=1.0)
-            P.assemble()
+
+    def J_mono(self, snes, x, J, P):
+        self._J_mono_no_precon(snes, x, J, P)
+        P.zeroEntries()
+        dolfinx.fem.petsc.assemble_matrix(
+            P, self.a_precon, bcs=self.bcs, diagonal=1.0)
+        P.assemble()
 
     def F_block(self, snes, x, F):
         assert x.getType() != "nest"
@@ -51,30 +92,40 @@ class NonlinearPDE_SNESProblem():
         with F.localForm() as f_local:
             f_local.set(0.0)
 
-        offset = 0
+        if self._block_layout is None:
+            # The local sizes of the subvectors are fixed, so record the
+            # slice of the block vector belonging to each variable once
+            offset = 0
+            self._block_layout = []
+            for var in self.soln_vars:
+                size_local = var.vector.getLocalSize()
+                self._block_layout.append(
+                    (var.vector, offset, offset + size_local))
+                offset += size_local
+
         x_array = x.getArray(readonly=True)
-        for var in self.soln_vars:
-            size_local = var.vector.getLocalSize()
-            var.vector.array[:] = x_array[offset: offset + size_local]
-            var.vector.ghostUpdate(addv=PETSc.InsertMode.INSERT,
-                                   mode=PETSc.ScatterMode.FORWARD)
-            offset += size_local
+        for var_vec, begin, end in self._block_layout:
+            var_vec.array[:] = x_array[begin:end]
+            var_vec.ghostUpdate(addv=PETSc.InsertMode.INSERT,
+                                mode=PETSc.ScatterMode.FORWARD)
 
         dolfinx.fem.petsc.assemble_vector_block(
             F, self.L, self.a, bcs=self.bcs, x0=x, scale=-1.0)
 
-    def J_block(self, snes, x, J, P):
-        assert x.getType() != "nest" and J.getType() != "nest" \
-               and P.getType() != "nest"
+    def _J_block_no_precon(self, snes, x, J, P):
+        assert x.getType() != "nest" and J.getType() != "nest"
         J.zeroEntries()
         dolfinx.fem.petsc.assemble_matrix_block(
             J, self.a, bcs=self.bcs, diagonal=1.0)
         J.assemble()
-        if self.a_precon is not None:
-            P.zeroEntries()
-            dolfinx.fem.petsc.assemble_matrix_block(
-                P, self.a_precon, bcs=self.bcs, diagonal=1.0)
-            P.assemble()
+
+    def J_block(self, snes, x, J, P):
+        assert P.getType() != "nest"
+        self._J_block_no_precon(snes, x, J, P)
+        P.zeroEntries()
+        dolfinx.fem.petsc.assemble_matrix_block(
+            P, self.a_precon, bcs=self.bcs, diagonal=1.0)
+        P.assemble()
 
     def F_nest(self, snes, x, F):
         assert x.getType() == "nest" and F.getType() == "nest"
@@ -87,8 +138,7 @@ class NonlinearPDE_SNESProblem():
                 var_sub.x.array[:] = _x.array_r
 
         # Assemble
-        bcs1 = dolfinx.fem.bcs_by_block(
-            dolfinx.fem.extract_function_spaces(self.a, 1), self.bcs)
+        bcs1 = self._bcs1
         for L, F_sub, a in zip(self.L, F.getNestSubVecs(), self.a):
             with F_sub.localForm() as F_sub_local:
                 F_sub_local.set(0.0)
@@ -97,21 +147,22 @@ class NonlinearPDE_SNESProblem():
             F_sub.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
 
         # Set bc value in RHS
-        bcs0 = dolfinx.fem.bcs_by_block(
-            dolfinx.fem.extract_function_spaces(self.L), self.bcs)
-        for F_sub, bc, x_sub in zip(F.getNestSubVecs(), bcs0, x):
+        for F_sub, bc, x_sub in zip(F.getNestSubVecs(), self._bcs0, x):
             dolfinx.fem.set_bc(F_sub, bc, x_sub, -1.0)
 
         # Must assemble F here in the case of nest matrices
         F.assemble()
 
-    def J_nest(self, snes, x, J, P):
-        assert J.getType() == "nest" and P.getType() == "nest"
+    def _J_nest_no_precon(self, snes, x, J, P):
+        assert J.getType() == "nest"
         J.zeroEntries()
         dolfinx.fem.petsc.assemble_matrix_nest(J, self.a, bcs=self.bcs, diagonal=1.0)
         J.assemble()
-        if self.a_precon is not None:
-            P.zeroEntries()
-            dolfinx.fem.petsc.assemble_matrix_nest(
-                P, self.a_precon, bcs=self.bcs, diagonal=1.0)
-            P.assemble()
+
+    def J_nest(self, snes, x, J, P):
+        assert P.getType() == "nest"
+        self._J_nest_no_precon(snes, x, J, P)
+        P.zeroEntries()
+        dolfinx.fem.petsc.assemble_matrix_nest(
+            P, self.a_precon, bcs=self.bcs, diagonal=1.0)
+        P.assemble()
@@ -159,13 +159,24 @@ class LocalLaxFriedrichs(ConvectiveFlux):
     def __init__(self, flux_jacobian_eigenvalues):
         self.flux_jacobian_eigenvalues = flux_jacobian_eigenvalues
         self.alpha = None
+        self._max_eigen_cache = {}
+
+    def _max_abs_eigenvalues(self, u, n):
+        """Memoised maximum absolute eigenvalue estimate. The same state
+        appears in the setup of many facet terms, e.g. the interior
+        solution paired with the data of each boundary condition, so
+        reuse the eigenvalue reduction rather than rebuilding it.
+        """
+        key = (u, n)
+        lam = self._max_eigen_cache.get(key)
+        if lam is None:
+            lam = max_abs_of_sequence(self.flux_jacobian_eigenvalues(u, n))
+            self._max_eigen_cache[key] = lam
+        return lam
 
     def setup(self, F_c, u_p, u_m, n):
-        eigen_vals_max_p = max_abs_of_sequence(
-            self.flux_jacobian_eigenvalues(u_p, n))
-        eigen_vals_max_m = max_abs_of_sequence(
-            self.flux_jacobian_eigenvalues(u_m, n))
-        self.alpha = Max(eigen_vals_max_p, eigen_vals_max_m)
+        self.alpha = Max(self._max_abs_eigenvalues(u_p, n),
+                         self._max_abs_eigenvalues(u_m, n))
 
     def interior(self, F_c, u_p, u_m, n):
         return 0.5*(dot(F_c(u_p), n) + dot(F_c(u_m), n)
@@ -1,9 +1,9 @@
+import functools
 import inspect
 
 import ufl
 from ufl import (
-    grad, inner, curl, dot, as_vector, tr, Identity, variable, diff, exp,
-    Measure, FacetNormal
+    grad, inner, curl, dot, as_vector, tr, Identity, exp, Measure
 )
 
 from dolfin_dg import aero, generate_default_sipg_penalty_term
@@ -78,12 +78,13 @@ class DGFemFormulation:
         # the DUNE way
         if hasattr(mesh, "dimension"):
             return mesh.dimension
-        else:
-        # the Fenics/Dolfin way
-            try:
-                return mesh.geometry().dim()
-            except AttributeError:
-                return mesh.geometric_dimension()
+        # the Fenics/Dolfin way, dispatching on the attribute rather than
+        # catching AttributeError so no exception machinery runs on the
+        # common paths
+        geometry = getattr(mesh, "geometry", None)
+        if geometry is not None:
+            return geometry().dim()
+        return mesh.geometric_dimension()
 
     def __init__(self, mesh, fspace, bcs):
         """
@@ -98,12 +99,104 @@ class DGFemFormulation:
             List of :class:`dolfin_dg.operators.DGBC` to be weakly imposed and
             included in the formulation
         """
-        if not hasattr(bcs, '__len__'):
-            bcs = [bcs]
+        if not isinstance(bcs, (list, tuple)):
+            bcs = (bcs,)
         self.mesh = mesh
         self.fspace = fspace
-        self.dirichlet_bcs = [bc for bc in bcs if isinstance(bc, DGDirichletBC)]
-        self.neumann_bcs = [bc for bc in bcs if isinstance(bc, DGNeumannBC)]
+
+        # The compressible Navier-Stokes operators initialise both their
+        # hyperbolic and elliptic bases, and each base ends up here. The
+        # BC partition and formulation caches only need setting up on the
+        # first visit
+        if getattr(self, '_bcs_partitioned', False):
+            return
+        self._bcs_partitioned = True
+
+        # Partition the BCs by type in a single pass. The adiabatic wall
+        # bucket is only consumed by the compressible Navier-Stokes
+        # operators, but keeping it here lets all subclasses share one
+        # traversal of the BC list
+        self.dirichlet_bcs = []
+        self.neumann_bcs = []
+        self.adiabatic_wall_bcs = []
+        for bc in bcs:
+            if isinstance(bc, DGDirichletBC):
+                self.dirichlet_bcs.append(bc)
+            elif isinstance(bc, DGNeumannBC):
+                self.neumann_bcs.append(bc)
+            elif isinstance(bc, DGAdiabticWallBC):
+                self.adiabatic_wall_bcs.append(bc)
+        self._G_cache = {}
+        self._penalty_cache = {}
+        self._residual_cache = {}
+        self._dx_default = None
+        self._dS_default = None
+        self._n_default = None
+
+    def _default_measures(self, dx, dS):
+        """Return the volume and interior facet measures, constructing and
+        memoising the defaults on this mesh for those the caller does not
+        prescribe. Sharing the measure objects keeps the integration
+        metadata identical across operators, which is required for the
+        form compiler to deduplicate the generated kernels.
+        """
+        if dx is None:
+            if self._dx_default is None:
+                self._dx_default = Measure('dx', domain=self.mesh)
+            dx = self._dx_default
+        if dS is None:
+            if self._dS_default is None:
+                self._dS_default = Measure('dS', domain=self.mesh)
+            dS = self._dS_default
+        return dx, dS
+
+    def _facet_normal(self):
+        """Memoised outward pointing facet normal on this mesh. The normal
+        appears throughout the facet terms of every formulation, and
+        reusing a single UFL node keeps the expression tree compact.
+        """
+        if self._n_default is None:
+            self._n_default = ufl.FacetNormal(self.ufl_domain())
+        return self._n_default
+
+    def _default_penalty(self, u):
+        """Memoised default SIPG penalty parameter. Deriving the penalty
+        traverses the UFL DAG of `u` to find the approximating polynomial
+        degree, and reusing the resulting UFL node across formulation
+        terms helps the form compiler deduplicate kernels.
+        """
+        penalty = self._penalty_cache.get(u)
+        if penalty is None:
+            penalty = generate_default_sipg_penalty_term(u)
+            self._penalty_cache[u] = penalty
+        return penalty
+
+    def _homogeneity_tensor(self, F_v, u, differential_operator=grad):
+        """Memoised wrapper of :func:`dolfin_dg.dg_form.homogeneity_tensor`.
+        Generating the homogeneity tensor differentiates through the full
+        flux tensor, so repeated formulation generation with the same flux
+        function and solution variable reuses the previously constructed
+        UFL tree.
+        """
+        key = (F_v, u, differential_operator)
+        G = self._G_cache.get(key)
+        if G is None:
+            G = homogeneity_tensor(
+                F_v, u, differential_operator=differential_operator)
+            self._G_cache[key] = G
+        return G
+
+    def _cached_residual(self, key, build_residual):
+        """Memoised residual construction. Generating a formulation
+        builds the complete UFL tree of the residual, so repeated calls
+        with the same arguments, e.g. re-generating the form inside a
+        time-stepping loop, return the previously constructed form.
+        """
+        residual = self._residual_cache.get(key)
+        if residual is None:
+            residual = build_residual()
+            self._residual_cache[key] = residual
+        return residual
 
     def ufl_domain(self):
         try:
@@ -163,18 +256,13 @@ class EllipticOperator(DGFemFormulation):
         DGFemFormulation.__init__(self, mesh, fspace, bcs)
         self.F_v = F_v
 
-    def generate_fem_formulation(self, u, v, dx=None, dS=None, vt=None,
-                                 penalty=None):
-        if dx is None:
-            dx = Measure('dx', domain=self.mesh)
-        if dS is None:
-            dS = Measure('dS', domain=self.mesh)
-
-        n = ufl.FacetNormal(self.ufl_domain())
-        G = homogeneity_tensor(self.F_v, u)
+    def _make_viscous_term(self, u, v, penalty, vt):
+        """Construct the DG term generator employed for the viscous flux"""
+        n = self._facet_normal()
+        G = self._homogeneity_tensor(self.F_v, u)
 
         if penalty is None:
-            penalty = generate_default_sipg_penalty_term(u)
+            penalty = self._default_penalty(u)
 
         if vt is None:
             vt = DGFemSIPG(self.F_v, u, v, penalty, G, n)
@@ -183,19 +271,30 @@ class EllipticOperator(DGFemFormulation):
             vt = vt(self.F_v, u, v, penalty, G, n)
 
         assert(isinstance(vt, DGFemTerm))
+        return vt
 
-        residual = inner(self.F_v(u, grad(u)), grad(v))*dx
-        residual += vt.interior_residual(dS)
+    def generate_fem_formulation(self, u, v, dx=None, dS=None, vt=None,
+                                 penalty=None):
+        dx, dS = self._default_measures(dx, dS)
 
-        for dbc in self.dirichlet_bcs:
-            residual += vt.exterior_residual(
-                dbc.get_function(), dbc.get_boundary())
+        def build_residual():
+            vt_term = self._make_viscous_term(u, v, penalty, vt)
 
-        for dbc in self.neumann_bcs:
-            residual += vt.neumann_residual(
-                dbc.get_function(), dbc.get_boundary())
+            residual = inner(self.F_v(u, grad(u)), grad(v))*dx
+            residual += vt_term.interior_residual(dS)
 
-        return residual
+            for dbc in self.dirichlet_bcs:
+                residual += vt_term.exterior_residual(
+                    dbc.get_function(), dbc.get_boundary())
+
+            for dbc in self.neumann_bcs:
+                residual += vt_term.neumann_residual(
+                    dbc.get_function(), dbc.get_boundary())
+
+            return residual
+
+        return self._cached_residual(
+            (EllipticOperator, u, v, dx, dS, vt, penalty), build_residual)
 
 
 class PoissonOperator(EllipticOperator):
@@ -253,30 +352,33 @@ class MaxwellOperator(DGFemFormulation):
         self.F_m = F_m
 
     def generate_fem_formulation(self, u, v, dx=None, dS=None, penalty=None):
-        if dx is None:
-            dx = Measure('dx', domain=self.mesh)
-        if dS is None:
-            dS = Measure('dS', domain=self.mesh)
+        dx, dS = self._default_measures(dx, dS)
 
-        n = ufl.FacetNormal(self.ufl_domain())
-        curl_u = variable(curl(u))
-        G = diff(self.F_m(u, curl_u), curl_u)
-        penalty = generate_default_sipg_penalty_term(u)
+        def build_residual():
+            n = self._facet_normal()
+            G = self._homogeneity_tensor(
+                self.F_m, u, differential_operator=curl)
+            sigma = penalty
+            if sigma is None:
+                sigma = self._default_penalty(u)
 
-        ct = DGFemCurlTerm(self.F_m, u, v, penalty, G, n)
+            ct = DGFemCurlTerm(self.F_m, u, v, sigma, G, n)
 
-        residual = inner(self.F_m(u, curl(u)), curl(v))*dx
-        residual += ct.interior_residual(dS)
+            residual = inner(self.F_m(u, curl(u)), curl(v))*dx
+            residual += ct.interior_residual(dS)
 
-        for dbc in self.dirichlet_bcs:
-            residual += ct.exterior_residual(
-                dbc.get_function(), dbc.get_boundary())
+            for dbc in self.dirichlet_bcs:
+                residual += ct.exterior_residual(
+                    dbc.get_function(), dbc.get_boundary())
 
-        for dbc in self.neumann_bcs:
-            residual += ct.neumann_residual(
-                dbc.get_function(), dbc.get_boundary())
+            for dbc in self.neumann_bcs:
+                residual += ct.neumann_residual(
+                    dbc.get_function(), dbc.get_boundary())
 
-        return residual
+            return residual
+
+        return self._cached_residual(
+            (MaxwellOperator, u, v, dx, dS, penalty), build_residual)
 
 
 class HyperbolicOperator(DGFemFormulation):
@@ -309,6 +411,39 @@ class HyperbolicOperator(DGFemFormulation):
         DGFemFormulation.__init__(self, mesh, V, bcs)
         self.F_c = F_c
         self.H = H
+        self._H_setup_key = None
+
+    def _setup_flux(self, u_p, u_m, n):
+        """Prepare the convective flux scheme for the given states. The
+        setup of, e.g., a max wavespeed estimate constructs O(#eigenvalues)
+        UFL nodes, so skip it when the flux is already configured for these
+        arguments (such as consecutive BCs sharing their boundary data).
+        """
+        key = (u_p, u_m, n)
+        if key != self._H_setup_key:
+            self.H.setup(self.F_c, u_p, u_m, n)
+            self._H_setup_key = key
+
+    def _convective_interior_residual(self, u, v, dx, dS, n):
+        """Volume and interior facet terms of the convective operator"""
+        F_c_eval = self.F_c(u)
+        if len(F_c_eval.ufl_shape) == 0:
+            F_c_eval = as_vector((F_c_eval,))
+        residual = -inner(F_c_eval, grad(v))*dx
+
+        self._setup_flux(u('+'), u('-'), n('+'))
+        residual += inner(self.H.interior(self.F_c, u('+'), u('-'), n('+')),
+                          (v('+') - v('-')))*dS
+        return residual
+
+    def _convective_exterior_residual(self, u, v, gD, n, dSD):
+        """Weakly imposed Dirichlet BC term of the convective operator"""
+        self._setup_flux(u, gD, n)
+        return inner(self.H.exterior(self.F_c, u, gD, n), v)*dSD
+
+    def _convective_neumann_residual(self, u, v, n, dSN):
+        """Outflow BC term of the convective operator"""
+        return inner(dot(self.F_c(u), n), v)*dSN
 
     def generate_fem_formulation(self, u, v, dx=None, dS=None):
         """Automatically generate the DG FEM formulation
@@ -329,35 +464,25 @@ class HyperbolicOperator(DGFemFormulation):
         The UFL representation of the DG FEM formulation
         """
 
-        if dx is None:
-            dx = Measure('dx', domain=self.mesh)
-        if dS is None:
-            dS = Measure('dS', domain=self.mesh)
-
-        n = ufl.FacetNormal(self.ufl_domain())
+        dx, dS = self._default_measures(dx, dS)
 
-        F_c_eval = self.F_c(u)
-        if len(F_c_eval.ufl_shape) == 0:
-            F_c_eval = as_vector((F_c_eval,))
-        residual = -inner(F_c_eval, grad(v))*dx
-
-        self.H.setup(self.F_c, u('+'), u('-'), n('+'))
-        residual += inner(self.H.interior(self.F_c, u('+'), u('-'), n('+')),
-                          (v('+') - v('-')))*dS
+        def build_residual():
+            n = self._facet_normal()
 
-        for bc in self.dirichlet_bcs:
-            gD = bc.get_function()
-            dSD = bc.get_boundary()
+            residual = self._convective_interior_residual(u, v, dx, dS, n)
 
-            self.H.setup(self.F_c, u, gD, n)
-            residual += inner(self.H.exterior(self.F_c, u, gD, n), v)*dSD
+            for bc in self.dirichlet_bcs:
+                residual += self._convective_exterior_residual(
+                    u, v, bc.get_function(), n, bc.get_boundary())
 
-        for bc in self.neumann_bcs:
-            dSN = bc.get_boundary()
+            for bc in self.neumann_bcs:
+                residual += self._convective_neumann_residual(
+                    u, v, n, bc.get_boundary())
 
-            residual += inner(dot(self.F_c(u), n), v)*dSN
+            return residual
 
-        return residual
+        return self._cached_residual(
+            (HyperbolicOperator, u, v, dx, dS), build_residual)
 
 
 class SpacetimeBurgersOperator(HyperbolicOperator):
@@ -384,6 +509,25 @@ class SpacetimeBurgersOperator(HyperbolicOperator):
         HyperbolicOperator.__init__(self, mesh, V, bcs, F_c, flux)
 
 
+@functools.lru_cache(maxsize=8)
+def _identity(dim):
+    """Memoised UFL identity tensor shared by the compressible flow
+    fluxes"""
+    return Identity(dim)
+
+
+def _viscous_stress(mu, grad_u, dim):
+    r"""Viscous stress tensor of a Newtonian fluid under the Stokes
+    hypothesis
+
+    .. math:: \tau = \mu \left( \nabla \vec{u} + \nabla \vec{u}^\top
+        - \frac{2}{3} (\nabla \cdot \vec{u}) I \right)
+
+    shared by the compressible Navier-Stokes viscous fluxes
+    """
+    return mu*(grad_u + grad_u.T - 2.0/3.0*tr(grad_u)*_identity(dim))
+
+
 class CompressibleEulerOperator(HyperbolicOperator):
     r"""Specific implementation of
     :class:`dolfin_dg.operators.HyperbolicOperator` for the compressible Euler
@@ -416,22 +560,36 @@ class CompressibleEulerOperator(HyperbolicOperator):
 
         dim = self.mesh_dimension( mesh )
 
+        # F_c and alpha are each evaluated per facet term during form
+        # generation and derive the same primitive flow state from U.
+        # Memoise the derived quantities keyed on the (hashable) UFL
+        # expression so both closures share a single set of nodes
+        flow_state_cache = {}
+
+        def flow_state(U):
+            state = flow_state_cache.get(U)
+            if state is None:
+                rho, u, E = aero.flow_variables(U)
+                p = aero.pressure(U, gamma=gamma)
+                c = aero.speed_of_sound(p, rho, gamma=gamma)
+                H = aero.enthalpy(U, gamma=gamma)
+                state = (rho, u, E, p, c, H)
+                flow_state_cache[U] = state
+            return state
+
         def F_c(U):
-            rho, u, E = aero.flow_variables(U)
-            p = aero.pressure(U, gamma=gamma)
-            H = aero.enthalpy(U, gamma=gamma)
+            rho, u, E, p, c, H = flow_state(U)
 
-            inertia = rho*ufl.outer(u, u) + p*Identity(dim)
-            res = ufl.as_tensor([rho*u,
-                                 *[inertia[d, :] for d in range(dim)],
-                                 rho*H*u])
-            return res
+            inertia = rho*ufl.outer(u, u) + p*_identity(dim)
+            rows = [[rho*u[d] for d in range(dim)]]
+            rows += [[inertia[d, k] for k in range(dim)] for d in range(dim)]
+            rows += [[rho*H*u[d] for d in range(dim)]]
+            return ufl.as_matrix(rows)
 
         def alpha(U, n):
-            rho, u, E = aero.flow_variables(U)
-            p = aero.pressure(U, gamma=gamma)
-            c = aero.speed_of_sound(p, rho, gamma=gamma)
-            lambdas = [dot(u, n) - c, dot(u, n), dot(u, n) + c]
+            rho, u, E, p, c, H = flow_state(U)
+            un = dot(u, n)
+            lambdas = [un - c, un, un + c]
             return lambdas
 
         HyperbolicOperator.__init__(self, mesh, V, bcs, F_c,
@@ -485,11 +643,6 @@ class CompressibleNavierStokesOperator(EllipticOperator,
         """
         dim = self.mesh_dimension( mesh )
 
-        if not hasattr(bcs, '__len__'):
-            bcs = [bcs]
-        self.adiabatic_wall_bcs = [bc for bc in bcs
-                                   if isinstance(bc, DGAdiabticWallBC)]
-
         def F_v(U, grad_U):
             rho, rhou, rhoE = aero.conserved_variables(U)
             u = rhou/rho
@@ -498,17 +651,20 @@ class CompressibleNavierStokesOperator(EllipticOperator,
             grad_rhou = ufl.as_tensor([grad_U[j, :] for j in range(1, dim + 1)])
             grad_rhoE = grad_U[-1, :]
 
-            # Quotient rule to find grad(u) and grad(E)
-            grad_u = (grad_rhou*rho - ufl.outer(rhou, grad_rho))/rho**2
-            grad_E = (grad_rhoE*rho - rhoE*grad_rho)/rho**2
+            # Quotient rule to find grad(u) and grad(E), sharing a single
+            # 1/rho subexpression instead of dividing by rho**2 per row
+            rho_inv = 1.0/rho
+            grad_u = (grad_rhou - ufl.outer(rhou, grad_rho)*rho_inv)*rho_inv
+            grad_E = (grad_rhoE - rhoE*grad_rho*rho_inv)*rho_inv
 
-            tau = mu*(grad_u + grad_u.T - 2.0/3.0*(tr(grad_u))*Identity(dim))
+            tau = _viscous_stress(mu, grad_u, dim)
             K_grad_T = mu*gamma/Pr*(grad_E - dot(u, grad_u))
 
-            res = ufl.as_tensor([ufl.zero(dim),
-                                 *(tau[d, :] for d in range(dim)),
-                                 tau * u + K_grad_T])
-            return res
+            energy_flux = tau*u + K_grad_T
+            rows = [[0]*dim]
+            rows += [[tau[d, k] for k in range(dim)] for d in range(dim)]
+            rows += [[energy_flux[d] for d in range(dim)]]
+            return ufl.as_matrix(rows)
 
         # Specialised adiabatic wall BC
         def F_v_adiabatic(U, grad_U):
@@ -517,14 +673,17 @@ class CompressibleNavierStokesOperator(EllipticOperator,
 
             grad_rho = grad_U[0, :]
             grad_rhou = ufl.as_tensor([grad_U[j, :] for j in range(1, dim + 1)])
-            grad_u = (grad_rhou * rho - ufl.outer(rhou, grad_rho)) / rho ** 2
 
-            tau = mu*(grad_u + grad_u.T - 2.0/3.0*(tr(grad_u))*Identity(dim))
+            rho_inv = 1.0/rho
+            grad_u = (grad_rhou - ufl.outer(rhou, grad_rho)*rho_inv)*rho_inv
 
-            res = ufl.as_tensor([ufl.zero(dim),
-                                 *(tau[d, :] for d in range(dim)),
-                                 tau * u])
-            return res
+            tau = _viscous_stress(mu, grad_u, dim)
+
+            energy_flux = tau*u
+            rows = [[0]*dim]
+            rows += [[tau[d, k] for k in range(dim)] for d in range(dim)]
+            rows += [[energy_flux[d] for d in range(dim)]]
+            return ufl.as_matrix(rows)
 
         self.F_v_adiabatic = F_v_adiabatic
 
@@ -532,35 +691,55 @@ class CompressibleNavierStokesOperator(EllipticOperator,
         EllipticOperator.__init__(self, mesh, V, bcs, F_v)
 
     def generate_fem_formulation(self, u, v, dx=None, dS=None, penalty=None):
-        if dx is None:
-            dx = Measure('dx', domain=self.mesh)
-        if dS is None:
-            dS = Measure('dS', domain=self.mesh)
-
-        residual = EllipticOperator.generate_fem_formulation(
-            self, u, v, dx=dx, dS=dS, penalty=penalty)
-        residual += CompressibleEulerOperator.generate_fem_formulation(
-            self, u, v, dx=dx, dS=dS)
-
-        # Specialised adiabatic wall boundary condition
-        for bc in self.adiabatic_wall_bcs:
-            n = FacetNormal(self.mesh)
-
-            u_gamma = bc.get_function()
-            dSD = bc.get_boundary()
+        dx, dS = self._default_measures(dx, dS)
+
+        def build_residual():
+            n = self._facet_normal()
+            vt = self._make_viscous_term(u, v, penalty, None)
+
+            # Volume and interior facet terms of the viscous and convective
+            # operators
+            residual = inner(self.F_v(u, grad(u)), grad(v))*dx
+            residual += vt.interior_residual(dS)
+            residual += self._convective_interior_residual(u, v, dx, dS, n)
+
+            # Accumulate the viscous and convective contributions of the
+            # weakly imposed BCs in a single pass over each BC list
+            for bc in self.dirichlet_bcs:
+                gD = bc.get_function()
+                dSD = bc.get_boundary()
+
+                residual += self._convective_exterior_residual(
+                    u, v, gD, n, dSD)
+                residual += vt.exterior_residual(gD, dSD)
+
+            for bc in self.neumann_bcs:
+                dSN = bc.get_boundary()
+
+                residual += self._convective_neumann_residual(u, v, n, dSN)
+                residual += vt.neumann_residual(bc.get_function(), dSN)
+
+            # Specialised adiabatic wall boundary condition. The penalty
+            # parameter, homogeneity tensor and DG formulation are shared
+            # by all adiabatic wall BCs, so construct them only once
+            if self.adiabatic_wall_bcs:
+                G_adiabatic = self._homogeneity_tensor(self.F_v_adiabatic, u)
+                vt_adiabatic = DGFemSIPG(
+                    self.F_v_adiabatic, u, v, vt.sigma, G_adiabatic, n)
+
+            for bc in self.adiabatic_wall_bcs:
+                u_gamma = bc.get_function()
+                dSD = bc.get_boundary()
+
+                residual += self._convective_exterior_residual(
+                    u, v, u_gamma, n, dSD)
+                residual += vt_adiabatic.exterior_residual(u_gamma, dSD)
 
-            self.H.setup(self.F_c, u, u_gamma, n)
-            residual += inner(self.H.exterior(self.F_c, u, u_gamma, n), v)*dSD
-
-            if penalty is None:
-                penalty = generate_default_sipg_penalty_term(u)
-            G_adiabitic = homogeneity_tensor(self.F_v_adiabatic, u)
-            vt_adiabatic = DGFemSIPG(
-                self.F_v_adiabatic, u, v, penalty, G_adiabitic, n)
+            return residual
 
-            residual += vt_adiabatic.exterior_residual(u_gamma, dSD)
-
-        return residual
+        return self._cached_residual(
+            (CompressibleNavierStokesOperator, u, v, dx, dS, penalty),
+            build_residual)
 
 
 def V_to_U(V, gamma):
@@ -579,13 +758,80 @@ def V_to_U(V, gamma):
     mass, momentum and energy variables
     """
     V1, V2, V3, V4 = V
-    U = as_vector([-V4, V2, V3, 1 - 0.5*(V2**2 + V3**2)/V4])
-    s = gamma - V1 + (V2**2 + V3**2)/(2*V4)
-    rhoi = ((gamma - 1)/((-V4)**gamma))**(1.0/(gamma-1))*exp(-s/(gamma-1))
+    # Hoist the subexpressions shared between the entropy s, the scaling
+    # rhoi and the energy component. Note 1/(-V4)**gamma is written as
+    # (-V4)**(-gamma) to save a division node
+    gm1 = gamma - 1
+    inv_gm1 = 1.0/gm1
+    k = 0.5*(V2**2 + V3**2)/V4
+    U = as_vector([-V4, V2, V3, 1 - k])
+    s = gamma - V1 + k
+    rhoi = (gm1*(-V4)**(-gamma))**inv_gm1*exp(-s*inv_gm1)
     U = U*rhoi
     return U
 
 
+def U_and_dUdV(V, gamma):
+    r"""Map the entropy variables to the mass, momentum, energy variables
+    together with the Jacobian :math:`\partial U / \partial V` of that map.
+
+    The map of :func:`V_to_U` is :math:`U = \rho_\iota \tilde{U}` with
+    :math:`\tilde{U} = (-V_4, V_2, V_3, 1 - k)` and
+    :math:`k = (V_2^2 + V_3^2)/(2 V_4)`. By the chain and product rules
+
+    .. math::
+
+        \frac{\partial U_i}{\partial V_j} = \rho_\iota \left(
+        \frac{\partial \tilde{U}_i}{\partial V_j}
+        + \tilde{U}_i \frac{\partial \ln \rho_\iota}{\partial V_j} \right),
+        \quad
+        \frac{\partial \ln \rho_\iota}{\partial V} = \frac{1}{\gamma - 1}
+        \left(1, -\frac{V_2}{V_4}, -\frac{V_3}{V_4},
+        \frac{k - \gamma}{V_4}\right),
+
+    so the Jacobian is assembled in closed form from the same scalars as
+    the map itself. This avoids symbolically differentiating through the
+    exponential in :func:`V_to_U`, which inflates the UFL tree before the
+    form compiler's CSE pass, and shares one occurrence of
+    :math:`\rho_\iota` between the map and its Jacobian.
+
+    Parameters
+    ----------
+    V
+        Entropy variables
+    gamma
+        Ratio of specific heats
+
+    Returns
+    -------
+    The mass, momentum and energy variables and the Jacobian of the map
+    with respect to the entropy variables
+    """
+    V1, V2, V3, V4 = V
+    gm1 = gamma - 1
+    inv_gm1 = 1.0/gm1
+    V4_inv = 1.0/V4
+    k = 0.5*(V2**2 + V3**2)*V4_inv
+    U_hat = (-V4, V2, V3, 1 - k)
+    s = gamma - V1 + k
+    rhoi = (gm1*(-V4)**(-gamma))**inv_gm1*exp(-s*inv_gm1)
+
+    dlnrhoi = (inv_gm1,
+               -inv_gm1*V2*V4_inv,
+               -inv_gm1*V3*V4_inv,
+               inv_gm1*(k - gamma)*V4_inv)
+    dU_hat = ((0, 0, 0, -1),
+              (0, 1, 0, 0),
+              (0, 0, 1, 0),
+              (0, -V2*V4_inv, -V3*V4_inv, k*V4_inv))
+
+    U = as_vector([rhoi*U_hat[i] for i in range(4)])
+    dudv = ufl.as_matrix(
+        [[rhoi*(dU_hat[i][j] + U_hat[i]*dlnrhoi[j]) for j in range(4)]
+         for i in range(4)])
+    return U, dudv
+
+
 class CompressibleEulerOperatorEntropyFormulation(HyperbolicOperator):
     r"""Specific implementation of
     :class:`dolfin_dg.operators.HyperbolicOperator` for the entropy variable
@@ -609,25 +855,36 @@ class CompressibleEulerOperatorEntropyFormulation(HyperbolicOperator):
 
         dim = self.mesh_dimension( mesh )
 
+        # As in CompressibleEulerOperator, memoise the flow state shared
+        # by F_c and alpha, here additionally caching the map from the
+        # entropy to the conserved variables
+        flow_state_cache = {}
+
+        def flow_state(V):
+            state = flow_state_cache.get(V)
+            if state is None:
+                U = V_to_U(V, gamma)
+                rho, u, E = aero.flow_variables(U)
+                p = aero.pressure(U, gamma=gamma)
+                c = aero.speed_of_sound(p, rho, gamma=gamma)
+                H = aero.enthalpy(U, gamma=gamma)
+                state = (rho, u, E, p, c, H)
+                flow_state_cache[V] = state
+            return state
+
         def F_c(V):
-            V = variable(V)
-            U = V_to_U(V, gamma)
-            rho, u, E = aero.flow_variables(U)
-            p = aero.pressure(U, gamma=gamma)
-            H = aero.enthalpy(U, gamma=gamma)
+            rho, u, E, p, c, H = flow_state(V)
 
-            inertia = rho*ufl.outer(u, u) + p*Identity(dim)
-            res = ufl.as_tensor([rho*u,
-                                 *[inertia[d, :] for d in range(dim)],
-                                 rho*H*u])
-            return res
+            inertia = rho*ufl.outer(u, u) + p*_identity(dim)
+            rows = [[rho*u[d] for d in range(dim)]]
+            rows += [[inertia[d, k] for k in range(dim)] for d in range(dim)]
+            rows += [[rho*H*u[d] for d in range(dim)]]
+            return ufl.as_matrix(rows)
 
         def alpha(V, n):
-            U = V_to_U(V, gamma)
-            rho, u, E = aero.flow_variables(U)
-            p = aero.pressure(U, gamma=gamma)
-            c = aero.speed_of_sound(p, rho, gamma=gamma)
-            lambdas = [dot(u, n) - c, dot(u, n), dot(u, n) + c]
+            rho, u, E, p, c, H = flow_state(V)
+            un = dot(u, n)
+            lambdas = [un - c, un, un + c]
             return lambdas
 
         HyperbolicOperator.__init__(self, mesh, V, bcs, F_c,
@@ -666,9 +923,7 @@ class CompressibleNavierStokesOperatorEntropyFormulation(
         dim = self.mesh_dimension( mesh )
 
         def F_v(V, grad_V):
-            V = variable(V)
-            U = V_to_U(V, gamma)
-            dudv = diff(U, V)
+            U, dudv = U_and_dUdV(V, gamma)
             grad_U = dot(dudv, grad_V)
 
             rho, rhou, rhoE = aero.conserved_variables(U)
@@ -678,10 +933,11 @@ class CompressibleNavierStokesOperatorEntropyFormulation(
             grad_rhou = ufl.as_tensor([grad_U[j, :] for j in range(1, dim + 1)])
             grad_rhoE = grad_U[-1, :]
 
-            grad_u = (grad_rhou*rho - ufl.outer(rhou, grad_rho))/rho**2
-            grad_E = (grad_rhoE*rho - rhoE*grad_rho)/rho**2
+            rho_inv = 1.0/rho
+            grad_u = (grad_rhou - ufl.outer(rhou, grad_rho)*rho_inv)*rho_inv
+            grad_E = (grad_rhoE - rhoE*grad_rho*rho_inv)*rho_inv
 
-            tau = mu*(grad_u + grad_u.T - 2.0/3.0*(tr(grad_u))*Identity(dim))
+            tau = _viscous_stress(mu, grad_u, dim)
             K_grad_T = mu*gamma/Pr*(grad_E - dot(u, grad_u))
 
             res = ufl.as_tensor([ufl.zero(dim),
@@ -694,10 +950,7 @@ class CompressibleNavierStokesOperatorEntropyFormulation(
         EllipticOperator.__init__(self, mesh, V, bcs, F_v)
 
     def generate_fem_formulation(self, u, v, dx=None, dS=None, penalty=None):
-        if dx is None:
-            dx = Measure('dx', domain=self.mesh)
-        if dS is None:
-            dS = Measure('dS', domain=self.mesh)
+        dx, dS = self._default_measures(dx, dS)
 
         residual = EllipticOperator \
             .generate_fem_formulation(self, u, v, dx=dx, dS=dS, penalty=penalty)
@@ -766,17 +1019,14 @@ class StokesOperator(DGFemFormulation):
         The UFL representation of the DG FEM formulation
         """
 
-        if dx is None:
-            dx = Measure('dx', domain=self.mesh)
-        if dS is None:
-            dS = Measure('dS', domain=self.mesh)
+        dx, dS = self._default_measures(dx, dS)
 
-        n = ufl.FacetNormal(self.ufl_domain())
-        G = homogeneity_tensor(self.F_v, u)
+        n = self._facet_normal()
+        G = self._homogeneity_tensor(self.F_v, u)
         delta = -1
 
         if penalty is None:
-            penalty = generate_default_sipg_penalty_term(u)
+            penalty = self._default_penalty(u)
 
         vt = DGFemStokesTerm(self.F_v, u, p, v, q, penalty, G, n, delta,
                              block_form=block_form)
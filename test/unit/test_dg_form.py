@@ -1,6 +1,7 @@
 import pytest
 import ufl
 from ufl.algorithms.apply_derivatives import apply_derivatives
+from ufl.algorithms.renumbering import renumber_indices
 
 from dolfin_dg.dg_form import homogeneity_tensor, hyper_tensor_product
 
@@ -49,3 +50,22 @@ def test_linear_homogeneity_tensor_product(element, F1):
     grad_u = ufl.dot(ufl.Identity(cell_dim), ufl.grad(u))
 
     assert F == grad_u
+
+
+@pytest.mark.parametrize("element", vector_eles)
+def test_vector_linear_homogeneity_tensor(element, F1):
+    cell_dim = element.cell().geometric_dimension()
+    dim = element.value_size()
+
+    u = ufl.Coefficient(element)
+    G = homogeneity_tensor(F1, u)
+    G = apply_derivatives(G)
+
+    # G_{ikjl} = delta_{ij} delta_{kl}. Free indices are numbered by
+    # construction order, so compare after canonical renumbering
+    i, k, j, l = ufl.indices(4)
+    expected = ufl.as_tensor(
+        ufl.Identity(cell_dim)[k, l]*ufl.Identity(dim)[i, j],
+        (i, k, j, l))
+
+    assert renumber_indices(G) == renumber_indices(expected)